@@ -8,7 +8,7 @@ def get_first_armature(objects: list[bpy.types.Object] | None = None) -> bpy.typ
     :param objects: List of objects to search in. If None, search through all objects in the file.
     :return: The first armature found or None.
     """
-    objs = objects or list(bpy.data.objects)  # type: ignore
+    objs = objects or bpy.data.objects  # type: ignore
     return next((obj for obj in objs if obj.type == "ARMATURE"), None)  # type: ignore
 
 
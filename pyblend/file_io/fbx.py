@@ -17,10 +17,11 @@ def export_fbx(filepath: Path | str, **kwargs) -> tuple[bool, str]:
     :param kwargs: Export settings.
     :return: A tuple with it's first element indicating whether export was successful, a message as the second element.
     """
+    # Check if the file has a valid extension.
+    is_fbx = Path(filepath).suffix.lower() == ".fbx"
     # The exporter add-on's function expects a string.
     filepath = str(filepath)
-    # Check if the file has a valid extension.
-    if not filepath.lower().endswith(".fbx"):
+    if not is_fbx:
         return (False, f"Destination file is not an FBX file: {filepath}")
     # Create a pseudo operator needed for export function.
     pseudo_operator = DummyOperator()
@@ -5,6 +5,8 @@ from pathlib import Path
 
 import bpy
 
+GLTF_EXTENSIONS = frozenset({".glb", ".gltf"})
+
 
 def export_gltf(filepath: Path | str, **kwargs) -> tuple[bool, str]:
     """Export to a glTF file.
@@ -15,8 +17,9 @@ def export_gltf(filepath: Path | str, **kwargs) -> tuple[bool, str]:
     :param kwargs: Export settings.
     :return: A tuple with it's first element indicating whether export was successful, a message as the second element.
     """
+    is_gltf = Path(filepath).suffix.lower() in GLTF_EXTENSIONS
     filepath = str(filepath)
-    if not (filepath.lower().endswith(".glb") or filepath.lower().endswith(".gltf")):
+    if not is_gltf:
         return (False, f"Destination file is not a glTF file: {filepath}")
 
     try:
@@ -1,5 +1,11 @@
 # <pep8 compliant>
 
+import json
+import logging
+import os
+import subprocess
+import sys
+import tempfile
 from pathlib import Path
 from typing import Union
 
@@ -15,3 +21,70 @@ def render_image(filepath: Union[Path, str], **keywords):
     filepath = keywords.pop("filepath", filepath)
     bpy.context.scene.render.filepath = str(filepath)
     bpy.ops.render.render(write_still=True)
+
+
+def render_images(jobs: list[dict], num_procs: int | None = None, blend_file: Path | str | None = None) -> bool:
+    """Render images in parallel background Blender processes.
+
+    Each job is a dictionary with the keyword arguments for render_image. The jobs are split evenly among the processes.
+
+    :param jobs: Render jobs.
+    :param num_procs: Number of Blender processes to start, defaults to the number of CPUs.
+    :param blend_file: Blend-file to render from, defaults to the currently opened file, which must be saved.
+    :return: True if all processes finished successfully, False otherwise.
+    """
+    if not jobs:
+        return True
+    if blend_file is None:
+        if not bpy.data.filepath:
+            logging.error("Cannot render images in background processes. The current file is not saved.")
+            return False
+        if bpy.data.is_dirty:
+            logging.warning("The current file has unsaved changes. Rendering its last saved state.")
+        blend_file = bpy.data.filepath
+    num_procs = max(1, min(num_procs or os.cpu_count() or 1, len(jobs)))
+    # Share the CPU cores among the processes instead of each process using all of them.
+    num_threads = max(1, (os.cpu_count() or 1) // num_procs)
+    processes = []
+    job_files = []
+    success = True
+    try:
+        for i in range(num_procs):
+            # Pass the jobs via file, they may exceed the command line length limit.
+            with tempfile.NamedTemporaryFile("w", suffix=".json", delete=False) as job_file:
+                json.dump(jobs[i::num_procs], job_file, default=str)
+            job_files.append(job_file.name)
+            cmd = [
+                bpy.app.binary_path,
+                "--background",
+                str(blend_file),
+                "--threads",
+                str(num_threads),
+                "--python-exit-code",
+                "1",
+                "--python",
+                __file__,
+                "--",
+                job_file.name,
+            ]
+            processes.append(subprocess.Popen(cmd))
+        for process in processes:
+            if process.wait() != 0:
+                logging.error(f"Render process {process.pid} failed with exit code {process.returncode}.")
+                success = False
+    finally:
+        # Don't leave processes behind if starting or waiting for them was interrupted.
+        for process in processes:
+            if process.poll() is None:
+                process.terminate()
+                process.wait()
+        for job_file_path in job_files:
+            Path(job_file_path).unlink(missing_ok=True)
+    return success
+
+
+if __name__ == "__main__":
+    # Entry point for processes started by render_images. Arguments after "--" are meant for this script.
+    with open(sys.argv[sys.argv.index("--") + 1]) as job_file:
+        for job in json.load(job_file):
+            render_image(**job)
@@ -6,6 +6,9 @@ from pathlib import Path
 import addon_utils
 import bpy
 
+_SHAPE_SUFFIX_RE = re.compile(r"(.*)-\w$")
+_addon_modules: list | None = None
+
 
 def path_exists(path: Path) -> bool:
     """Check if a path exists and is a directory.
@@ -62,19 +65,45 @@ def remove_shape_suffix(filepath: Path | str) -> Path:
     :return: Path to new file name without shape suffix.
     """
     filepath = Path(filepath)
-    new_name = re.sub(r"(.*)-\w$", r"\g<1>", filepath.stem)
-    return filepath.with_stem(new_name)
+    return filepath.with_stem(_SHAPE_SUFFIX_RE.sub(r"\g<1>", filepath.stem))
+
+
+def _get_addon_modules() -> list:
+    """Return the add-on modules, scanning for them only on first use."""
+    global _addon_modules
+    if _addon_modules is None:
+        _addon_modules = list(addon_utils.modules())
+    return _addon_modules
+
+
+@bpy.app.handlers.persistent
+def clear_addon_modules_cache(*_):
+    """Clear the cached add-on modules, so they are scanned again on next use.
+
+    Call this after installing or removing add-ons. It's also called after loading a file.
+    """
+    global _addon_modules
+    _addon_modules = None
+
+
+# Compare by name, since reloading this module creates a new function object.
+if not any(
+    handler.__module__ == clear_addon_modules_cache.__module__
+    and handler.__name__ == clear_addon_modules_cache.__name__
+    for handler in bpy.app.handlers.load_post
+):
+    bpy.app.handlers.load_post.append(clear_addon_modules_cache)
 
 
 def get_addon_path(addon_name: str) -> Path | None:
     """Return the path to the add-on folder."""
-    return next((Path(mod.__file__).parent for mod in addon_utils.modules() if mod.bl_info["name"] == addon_name), None)
+    return next((Path(mod.__file__).parent for mod in _get_addon_modules() if mod.bl_info["name"] == addon_name), None)
 
 
-def get_addon_name(addon_path: str | Path) -> Path | None:
+def get_addon_name(addon_path: str | Path) -> str | None:
     """Return the name of the add-on given a path."""
     addon_path = get_abs_path(addon_path)
-    addon_names = (
-        mod.bl_info["name"] for mod in addon_utils.modules() if Path(mod.__file__).parent in addon_path.parents
-    )
+    # Keep paths as Path objects, so they compare according to the platform's rules.
+    parent_paths = {addon_path, *addon_path.parents}
+    addon_names = (mod.bl_info["name"] for mod in _get_addon_modules() if Path(mod.__file__).parent in parent_paths)
     return next(addon_names, None)
@@ -16,17 +16,19 @@ def maintain_object_selection():
         ...     bpy.ops.object.select_all(action='SELECT')
         >>> # Selection restored
     """
-    previous_selection = [obj for obj in bpy.data.objects if obj.select_get()]
+    view_layer_objects = bpy.context.view_layer.objects
+    previous_selection = set(view_layer_objects.selected)
     active_object = bpy.context.active_object
     try:
         yield
     finally:
-        if previous_selection:
-            for obj in previous_selection:
-                obj.select_set(True)
-        else:
-            bpy.ops.object.select_all(action="DESELECT")
-        bpy.context.view_layer.objects.active = active_object
+        # Only touch objects whose selection state changed.
+        current_selection = set(view_layer_objects.selected)
+        for obj in current_selection - previous_selection:
+            obj.select_set(False)
+        for obj in previous_selection - current_selection:
+            obj.select_set(True)
+        view_layer_objects.active = active_object
 
 
 @contextlib.contextmanager
@@ -41,18 +43,48 @@ def maintain_object_visibility(objects: list[bpy.types.Object] | None = None):
         ...     bpy.context.active_object.hide_viewport = True
         >>> # Visibility restored
     """
-    if objects is None:
-        objects = bpy.data.objects
-    previous_visibility = {obj.name: (obj.hide_viewport, obj.hide_render) for obj in objects}
+    all_objects = bpy.data.objects
+    if objects is not None:
+        previous_visibility = {obj.name: (obj.hide_viewport, obj.hide_render) for obj in objects}
+        try:
+            yield
+        finally:
+            for obj_name, (viewport, render) in previous_visibility.items():
+                obj = all_objects.get(obj_name)
+                if obj is not None:
+                    _restore_visibility(obj, viewport, render)
+        return
+
+    names = all_objects.keys()
+    hide_viewport = np.empty(len(names), dtype=bool)
+    hide_render = np.empty(len(names), dtype=bool)
+    all_objects.foreach_get("hide_viewport", hide_viewport)
+    all_objects.foreach_get("hide_render", hide_render)
     try:
         yield
     finally:
-        for obj_name, (viewport, render) in previous_visibility.items():
-            obj = bpy.data.objects.get(obj_name)
-            if obj is None:
-                continue
-            obj.hide_viewport = viewport
-            obj.hide_render = render
+        if all_objects.keys() == names:
+            # Use the arrays only to find changed objects. Assigning runs the update callbacks, unlike foreach_set.
+            current_viewport = np.empty(len(names), dtype=bool)
+            current_render = np.empty(len(names), dtype=bool)
+            all_objects.foreach_get("hide_viewport", current_viewport)
+            all_objects.foreach_get("hide_render", current_render)
+            restore_indices = np.flatnonzero((current_viewport != hide_viewport) | (current_render != hide_render))
+        else:
+            # Objects were added or removed, restore by name.
+            restore_indices = range(len(names))
+        for i in restore_indices:
+            obj = all_objects.get(names[i])
+            if obj is not None:
+                _restore_visibility(obj, bool(hide_viewport[i]), bool(hide_render[i]))
+
+
+def _restore_visibility(obj: bpy.types.Object, hide_viewport: bool, hide_render: bool):
+    """Set the object's visibility, only assigning values that differ to avoid needless updates."""
+    if obj.hide_viewport != hide_viewport:
+        obj.hide_viewport = hide_viewport
+    if obj.hide_render != hide_render:
+        obj.hide_render = hide_render
 
 
 class CaptureObjects:
@@ -71,22 +103,19 @@ class CaptureObjects:
 
     def __init__(self, type_: str | None = None):
         self.type = type_
-        self.objects_before: list[bpy.types.Object] = []
-        self.objects_after: list[bpy.types.Object] = []
+        self._pointers_before: set[int] = set()
         self.difference: list[bpy.types.Object] = []
 
     def __enter__(self):
-        self.objects_before = self._get_objects()
+        self._pointers_before = {obj.as_pointer() for obj in bpy.data.objects}
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb) -> None:
-        self.objects_after = self._get_objects()
-        self.difference = list(set(self.objects_after) - set(self.objects_before))
-
-    def _get_objects(self) -> list[bpy.types.Object]:
-        if self.type is None:
-            return bpy.data.objects[:]
-        return [obj for obj in bpy.data.objects if obj.type == self.type]
+        self.difference = [
+            obj
+            for obj in bpy.data.objects
+            if obj.as_pointer() not in self._pointers_before and (self.type is None or obj.type == self.type)
+        ]
 
 
 def remove_object_from_file_by_name(name: str):
@@ -105,16 +134,13 @@ def remove_object_from_file(obj: bpy.types.Object) -> bool:
     :param obj: Object to remove
     :return: True if object was removed, False if object could not be removed.
     """
-    for collection in list(obj.users_collection):
-        collection.objects.unlink(obj)
-
-    obj.user_clear()
-    if not obj.users:
-        bpy.data.objects.remove(obj)
-        del obj
+    try:
+        # Unlinks the object from all its users before deleting it.
+        bpy.data.objects.remove(obj, do_unlink=True)
         return True
-    logging.warning(f"Object '{obj.name}' cannot be removed, still in use.")
-    return False
+    except (RuntimeError, ReferenceError) as error:
+        logging.warning(error)
+        return False
 
 
 def import_objects(
@@ -135,9 +161,11 @@ def import_objects(
     """
     with CaptureObjects() as captured_objects:
         with bpy.data.libraries.load(filepath=str(source_path), link=link, relative=relative) as (data_from, data_to):
-            data_to.objects = include or data_from.objects
-        # Link only objects that match our criteria. Objects that weren't found by name are None.
-        objects = list(filter(lambda obj: obj and obj.type == obj_type or not obj_type, data_to.objects))
+            # Don't request names that aren't in the source file. Object types are only known after loading.
+            available_names = set(data_from.objects)
+            data_to.objects = [name for name in include if name in available_names] if include else data_from.objects
+        # Link only objects that match our criteria.
+        objects = [obj for obj in data_to.objects if obj and (not obj_type or obj.type == obj_type)]
         for obj in objects:
             try:
                 bpy.context.scene.collection.objects.link(obj)
@@ -146,8 +174,8 @@ def import_objects(
                 continue
     # For reasons unknown, the armature is improted nonetheless from the source path. Get rid of it.
     uninvited_objects = set(captured_objects.difference) - set(objects)
-    for obj in uninvited_objects:
-        remove_object_from_file(obj)
+    # Batch removal also clears any remaining usages of the objects.
+    bpy.data.batch_remove(tuple(uninvited_objects))
     return objects
 
 
@@ -183,18 +211,19 @@ def unlink_objects(objects: list[bpy.types.Object], type_: str | None = None) ->
     return ret
 
 
+def _objects_by_type(type_: str) -> list[bpy.types.Object]:
+    """Get all objects of the given type in the file."""
+    return [obj for obj in bpy.data.objects if obj.type == type_]
+
+
 def get_mesh_objects() -> list[bpy.types.Object]:
     """Get all mesh objects in the file."""
-    return [obj for obj in bpy.data.objects if obj.type == "MESH"]
+    return _objects_by_type("MESH")
 
 
-def get_skinned_mesh_objects():
-    """Get all objects with an armature modifier."""
-    skinned_objects = []
-    for obj in bpy.data.objects:
-        if obj.type == "MESH":
-            skinned_objects.extend(obj for mod in obj.modifiers if mod.type == "ARMATURE")
-    return skinned_objects
+def get_skinned_mesh_objects() -> list[bpy.types.Object]:
+    """Get all mesh objects with an armature modifier."""
+    return [obj for obj in _objects_by_type("MESH") if any(mod.type == "ARMATURE" for mod in obj.modifiers)]
 
 
 def get_vertices_positions(context: bpy.types.Context, obj: bpy.types.Object) -> np.ndarray:
@@ -202,7 +231,7 @@ def get_vertices_positions(context: bpy.types.Context, obj: bpy.types.Object) ->
 
     :param context: Blender's current context.
     :param obj: Object from which to get evaluated vertex positions.
-    :return: Evaluated positions of vertices.
+    :return: Evaluated positions of vertices as float32 array of shape (n, 3), matching Blender's internal storage.
     """
     # Get the evaluated version of the object with modifiers applied.
     deps_graph = context.evaluated_depsgraph_get()
@@ -211,9 +240,8 @@ def get_vertices_positions(context: bpy.types.Context, obj: bpy.types.Object) ->
     mesh = eval_obj.to_mesh()
     vertices = mesh.vertices
     n_vertices = len(vertices)
-    positions = np.empty(n_vertices * 3)
-    vertices.foreach_get("co", positions)
-    positions = positions.reshape(n_vertices, 3)  # Not really necessary, but more intuitive.
+    positions = np.empty((n_vertices, 3), dtype=np.float32)
+    vertices.foreach_get("co", positions.ravel())  # Flat view of the same contiguous buffer.
     # Cleanup.
     eval_obj.to_mesh_clear()
     del mesh, vertices
@@ -226,14 +254,12 @@ def move_modifier_to_top(obj: bpy.types.Object, modifier_name: str):
     :param obj: Object that has the modifier in its stack.
     :param modifier_name: Name of modifier to move.
     """
-    try:
-        mod = obj.modifiers[modifier_name]
-    except KeyError:
+    index = obj.modifiers.find(modifier_name)
+    if index < 0:
         logging.warning(f"Modifier '{modifier_name}' not found in object '{obj.name}'.")
         return
-    while obj.modifiers.find(mod.name) != 0:
-        with bpy.context.temp_override(object=obj, active_object=obj):
-            bpy.ops.object.modifier_move_up(modifier=mod.name)
+    if index > 0:
+        obj.modifiers.move(index, 0)
 
 
 def add_color_attribute(mesh: bpy.types.Mesh, name: str) -> bpy.types.FloatColorAttribute:
@@ -253,9 +279,10 @@ def bake_ambient_occlusion_vtx(obj: bpy.types.Object, attribute_name: str = "AO"
     :param attribute_name: Name of vertex color attribute to bake to, defaults to "AO".
     :return: True if baking was successful, False if baking failed.
     """
-    bpy.data.scenes["Scene"].render.engine = "CYCLES"
-    bpy.data.scenes["Scene"].cycles.bake_type = "AO"
-    bpy.data.scenes["Scene"].render.bake.target = "VERTEX_COLORS"
+    scene = bpy.context.scene
+    scene.render.engine = "CYCLES"
+    scene.cycles.bake_type = "AO"
+    scene.render.bake.target = "VERTEX_COLORS"
     add_color_attribute(obj.data, attribute_name)
     window = bpy.context.window_manager.windows[0]
     with bpy.context.temp_override(window=window, selected_objects=[obj], active_object=obj, object=obj):
@@ -267,15 +294,26 @@ def bake_ambient_occlusion_vtx(obj: bpy.types.Object, attribute_name: str = "AO"
 
 
 def apply_transforms_to_delta(obj: bpy.types.Object):
-    """Apply the transforms of the given object to its delta transforms."""
-    # Convert the rotation to a quaternion, add it to the delta_rotation_quaternion, and then convert back to euler
-    obj.delta_rotation_quaternion.rotate(obj.rotation_euler)
-    obj.delta_rotation_euler = obj.delta_rotation_quaternion.to_euler("XYZ")
+    """Apply the transforms of the given object to its delta transforms.
+
+    The rotation is applied in the object's rotation mode. Axis-angle rotations have no delta counterpart in the
+    Python API and are left untouched.
+    """
+    # Blender applies the delta rotation before the rotation.
+    if obj.rotation_mode == "QUATERNION":
+        obj.delta_rotation_quaternion = obj.delta_rotation_quaternion @ obj.rotation_quaternion
+        obj.rotation_quaternion = (1.0, 0.0, 0.0, 0.0)
+    elif obj.rotation_mode == "AXIS_ANGLE":
+        logging.warning(f"Cannot apply axis-angle rotation of '{obj.name}' to delta transforms. Skipping rotation.")
+    else:
+        rotation = obj.delta_rotation_euler.to_matrix() @ obj.rotation_euler.to_matrix()
+        # Use the current delta rotation as compatibility hint to avoid flips.
+        obj.delta_rotation_euler = rotation.to_euler(obj.rotation_mode, obj.delta_rotation_euler)
+        obj.rotation_euler = (0.0, 0.0, 0.0)
 
     obj.delta_location += obj.location
     obj.delta_scale *= obj.scale
 
     # Clear the object's transforms
     obj.location = (0.0, 0.0, 0.0)
-    obj.rotation_euler = (0.0, 0.0, 0.0)
     obj.scale = (1.0, 1.0, 1.0)
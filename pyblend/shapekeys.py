@@ -22,28 +22,43 @@ def clear_shape_keys_weights(object: bpy.types.Object):
     :type objects: List[bpy.types.Object]
     """
     try:
-        for key in object.data.shape_keys.key_blocks:
-            key.value = 0.0
+        key_blocks = object.data.shape_keys.key_blocks
+        key_blocks.foreach_set("value", _get_cleared_weights(key_blocks))
+        # foreach_set doesn't run the shape key update, tag the key explicitly.
+        object.data.shape_keys.update_tag()
     except AttributeError:
         print(f"Cannot clear shape key weights. No shape keys on '{object.name}'!")
     object.active_shape_key_index = 0
     object.data.update()
 
 
+def _get_cleared_weights(key_blocks: bpy.types.bpy_prop_collection) -> np.ndarray:
+    """Get weights of 0 for the shape keys, clamped to their slider ranges.
+
+    foreach_set doesn't clamp values like assigning a single shape key value does.
+    """
+    n_keys = len(key_blocks)
+    slider_min = np.empty(n_keys, dtype=np.float32)
+    slider_max = np.empty(n_keys, dtype=np.float32)
+    key_blocks.foreach_get("slider_min", slider_min)
+    key_blocks.foreach_get("slider_max", slider_max)
+    return np.clip(np.zeros(n_keys, dtype=np.float32), slider_min, slider_max)
+
+
 def set_exclusive_shape_weight(mesh: bpy.types.Mesh, key: str, weight: float = 1.0):
     """Set target shape key weight, and all others to 0."""
     try:
-        mesh.shape_keys.key_blocks[key]
+        key_blocks = mesh.shape_keys.key_blocks
+        key_blocks[key]
     except KeyError:
         print(f"Error setting shape keys: Shape key '{key}' not found in '{mesh.name}'! Skipping.")
         return
     except AttributeError:
         print(f"Error setting shape keys: Mesh '{mesh.name}' has no shape keys! Skipping.")
         return
-    # foreach_set doesn't not work here, so we have to loop.
-    for shape in mesh.shape_keys.key_blocks:
-        shape.value = 0.0
-    mesh.shape_keys.key_blocks[key].value = weight
+    key_blocks.foreach_set("value", _get_cleared_weights(key_blocks))
+    # foreach_set doesn't run the shape key update, the single assignment below tags the key.
+    key_blocks[key].value = weight
     mesh.update()
 
 
@@ -71,12 +86,24 @@ def transfer_shape_keys(
     except AttributeError:
         print(f"No shape-keys on mesh '{src.name}'")
         return
+    src_keys = [src_key for src_key in src_shape_keys[1:] if not keys or src_key.name in keys]  # Skip basis.
     target.shape_key_clear()
     pyblend.shapekeys.add_shape_key(target, base_name)
-    for src_key in src_shape_keys[1:]:  # Skip basis shape key.
-        if keys and src_key.name not in keys:
-            continue
+    # Read all source data before writing to the target.
+    deltas = _get_shape_key_deltas(src_keys) if _is_bound_one_to_one(src, target) else {}
+    if deltas:
+        n_vertices = len(target.data.vertices)
+        rest_positions = np.empty(n_vertices * 3, dtype=np.float32)
+        target.data.vertices.foreach_get("co", rest_positions)
+        # Surface deform works in world space, map the offsets from the source's to the target's local space.
+        src_to_target = np.array((target.matrix_world.inverted() @ src.matrix_world).to_3x3(), dtype=np.float32)
+        deltas = {name: (delta.reshape(-1, 3) @ src_to_target.T).ravel() for name, delta in deltas.items()}
+    for src_key in src_keys:
         target_key = add_shape_key(target, src_key.name)
+        if src_key.name in deltas:
+            target_key.data.foreach_set("co", rest_positions + deltas[src_key.name])
+            continue
+        # Fall back to evaluating the deformation of the target.
         src_key.value = 1.0
         positions = pyblend.object.get_vertices_positions(context, target)
         set_shape_key_data(target_key, positions)
@@ -86,13 +113,77 @@ def transfer_shape_keys(
     target.active_shape_key_index = 0
 
 
+def _is_bound_one_to_one(src: bpy.types.Object, target: bpy.types.Object) -> bool:
+    """Check whether the target's vertices follow the source's vertices exactly.
+
+    This is the case when the target's only active modifier is a fully weighted surface deform bound to the unmodified
+    source, and both meshes share the same vertex positions in world space in rest pose.
+    """
+    if any(mod.show_viewport for mod in src.modifiers):
+        return False
+    # Absolute shape keys aren't offsets relative to a reference key.
+    if not src.data.shape_keys.use_relative:
+        return False
+    modifiers = [mod for mod in target.modifiers if mod.show_viewport]
+    if len(modifiers) != 1:
+        return False
+    mod = modifiers[0]
+    if mod.type != "SURFACE_DEFORM" or mod.target != src or not mod.is_bound:
+        return False
+    if mod.strength != 1.0 or mod.vertex_group:
+        return False
+    n_vertices = len(src.data.vertices)
+    if n_vertices != len(target.data.vertices):
+        return False
+    src_positions = np.empty(n_vertices * 3, dtype=np.float32)
+    target_positions = np.empty(n_vertices * 3, dtype=np.float32)
+    src.data.shape_keys.key_blocks[0].data.foreach_get("co", src_positions)
+    target.data.vertices.foreach_get("co", target_positions)
+    # Use a tolerance suitable for float32 precision.
+    return np.allclose(_to_world_space(src_positions, src), _to_world_space(target_positions, target), atol=1e-5)
+
+
+def _to_world_space(positions: np.ndarray, obj: bpy.types.Object) -> np.ndarray:
+    """Transform flat local vertex positions of an object to world space positions of shape (n, 3)."""
+    matrix = np.array(obj.matrix_world, dtype=np.float32)
+    return positions.reshape(-1, 3) @ matrix[:3, :3].T + matrix[:3, 3]
+
+
+def _get_shape_key_deltas(shape_keys: list[bpy.types.ShapeKey]) -> dict[str, np.ndarray]:
+    """Get the offsets of shape keys relative to their reference keys.
+
+    Shape keys restricted by a vertex group are omitted, as their deltas depend on the weights. Muted shape keys are
+    omitted, as they don't contribute to the deformation.
+
+    :param shape_keys: Shape keys for which to get the offsets.
+    :return: Flat float32 offset arrays by shape key name.
+    """
+    coordinates = {}
+
+    def get_coordinates(shape_key: bpy.types.ShapeKey) -> np.ndarray:
+        if shape_key.name not in coordinates:
+            co = np.empty(len(shape_key.data) * 3, dtype=np.float32)
+            shape_key.data.foreach_get("co", co)
+            coordinates[shape_key.name] = co
+        return coordinates[shape_key.name]
+
+    return {
+        key.name: get_coordinates(key) - get_coordinates(key.relative_key)
+        for key in shape_keys
+        if not (key.vertex_group or key.mute)
+    }
+
+
 def set_shape_key_data(shape_key: bpy.types.ShapeKey, data: np.ndarray):
     """Set the position data of a shape key.
 
     :param shape_key: Shape key which to modify.
-    :param data: Position data for vertices.
+    :param data: Position data for vertices of shape (n, 3). Should be float32 to avoid a conversion copy.
     """
     if data.shape[0] != len(shape_key.data):
         print(f"Mismatch between position data and vertex count for shape key '{shape_key.name}'")
         return
-    shape_key.data.foreach_set("co", data.flatten())
+    # Only copy if necessary, so that ravel returns a view.
+    if not (data.flags.c_contiguous and data.dtype == np.float32):
+        data = np.ascontiguousarray(data, dtype=np.float32)
+    shape_key.data.foreach_set("co", data.ravel())
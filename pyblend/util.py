@@ -4,23 +4,12 @@ import math
 from pathlib import Path
 
 import bpy
+import numpy as np
 
 
 def cleanup_unused_data():
     """Remove unused data blocks."""
-    blocks_types = [
-        bpy.data.meshes,
-        bpy.data.materials,
-        bpy.data.textures,
-        bpy.data.images,
-        bpy.data.armatures,
-        bpy.data.objects,
-        bpy.data.collections,
-    ]
-    for blocks in blocks_types:
-        for block in blocks:
-            if not block.users and hasattr(blocks, "remove"):
-                blocks.remove(block)
+    bpy.ops.outliner.orphans_purge(do_local_ids=True, do_linked_ids=True, do_recursive=True)
     unused_libs = [lib for lib in bpy.data.libraries if not lib.users_id]
     bpy.data.batch_remove(unused_libs)
 
@@ -57,3 +46,19 @@ def hex_to_rgb(hex_color: str) -> tuple[float, float, float]:
     rgb = tuple(int(hex_color[i : i + 2], 16) for i in (0, 2, 4))
     # Normalize values.
     return tuple(srgb_to_linear(x / 255.0) for x in rgb)
+
+
+def hex_to_rgb_batch(hex_colors: list[str]) -> np.ndarray:
+    """Convert hex color strings to linear RGB.
+
+    :param hex_colors: Hex color strings, e.g. "#ff8800".
+    :return: Linear RGB values as float32 array of shape (n, 3).
+    :raises ValueError: If a color is not a 6-digit hex string.
+    """
+    hex_colors = [color.lstrip("#") for color in hex_colors]
+    for color in hex_colors:
+        if len(color) != 6:
+            raise ValueError(f"Invalid hex color '{color}'. Expected 6 hex digits.")
+    srgb = np.frombuffer(bytes.fromhex("".join(hex_colors)), dtype=np.uint8)
+    srgb = srgb.reshape(-1, 3).astype(np.float32) / 255.0
+    return np.where(srgb <= 0.04045, srgb / 12.92, np.power((srgb + 0.055) / 1.055, 2.4)).astype(np.float32)